@@ -54,28 +54,34 @@ def client_test(addr: str = "127.0.0.1", port: int = 9002, verb=4, CLIENTS=1):
         except Exception as e:
             err("Failed to run Pings:", e)
 
-    set_verbosity(verb)
-    eventloop = asyncio.get_event_loop()
-
-    x = [
-        Client(addr, port).run_through(send_pings, loop=eventloop)
-        for _ in range(CLIENTS)
-    ]
-    # `run_through()` may take any number of Coroutines as Arguments. They will
-    #   be awaited, with the Client passed, sequentially.
+    async def run_clients(eventloop):
+        # `run_through()` may take any number of Coroutines as Arguments. They
+        #   will be awaited, with the Client passed, sequentially.
+        await asyncio.gather(
+            *(
+                Client(addr, port).run_through(send_pings, loop=eventloop)
+                for _ in range(CLIENTS)
+            )
+        )
 
+    set_verbosity(verb)
     try:
-        eventloop.run_until_complete(asyncio.gather(*x))
+        # noinspection PyPackageRequirements
+        from uvloop import new_event_loop
+    except ImportError:
+        new_event_loop = asyncio.new_event_loop
+
+    # Run on an Event Loop of our own, rather than replacing the global Policy.
+    with asyncio.Runner(loop_factory=new_event_loop) as runner:
+        eventloop = runner.get_loop()
+        try:
+            runner.run(run_clients(eventloop))
 
-    except KeyboardInterrupt:
-        print("INTERRUPT")
+        except KeyboardInterrupt:
+            print("INTERRUPT")
 
-    finally:
-        try:
-            tasks = asyncio.Task.all_tasks()
-            eventloop.run_until_complete(cleanup(tasks))
         finally:
-            eventloop.close()
+            runner.run(cleanup(asyncio.all_tasks(eventloop)))
 
 
 def server_test(addr: str = "127.0.0.1", port: int = 9002, verb=2, auto=False):
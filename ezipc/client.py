@@ -137,19 +137,17 @@ class Client:
 
         :param AbstractEventLoop loop: An AsyncIO Event Loop, or an external
             subclass thereof. The Loop on which to run the Remote.
-        :param int helpers: The number of Helper Tasks to be used by the Remote.
-            More Helpers can be useful when receiving prompts to perform very
-            await-heavy procedures, such as multiple file transfers, but when
-            not in use they mostly sap memory.
+        :param int helpers: The number of Lines the Remote may process at the
+            same time. More Helpers can be useful when receiving prompts to
+            perform very await-heavy procedures, such as multiple file
+            transfers.
         :param Union[float, int] timeout: The number of seconds to wait before
             giving up on trying to connect.
 
         :return: True if the Connection was successful, otherwise False.
         """
         try:
-            streams = await wait_for(
-                open_connection(self.addr, self.port, loop=loop), timeout
-            )
+            streams = await wait_for(open_connection(self.addr, self.port), timeout)
         except TimeoutError:
             err(f"Connection timed out after {timeout}s.")
             return False
@@ -219,21 +217,19 @@ class Client:
 
     def report(self, *_):
         try:
-            echo("info", "Sent:")
-            echo(
-                "tab",
-                [
-                    f"> {v} {k.capitalize()}{'' if v == 1 else 's'}"
-                    for k, v in self.remote.total_sent.items()
-                ],
-            )
-            echo("info", "Received:")
-            echo(
-                "tab",
+            P.emit_many(
                 [
-                    f"> {v} {k.capitalize()}{'' if v == 1 else 's'}"
-                    for k, v in self.remote.total_recv.items()
-                ],
+                    ("info", "Sent:"),
+                    *(
+                        ("tab", f"> {v} {k.capitalize()}{'' if v == 1 else 's'}")
+                        for k, v in self.remote.total_sent.items()
+                    ),
+                    ("info", "Received:"),
+                    *(
+                        ("tab", f"> {v} {k.capitalize()}{'' if v == 1 else 's'}")
+                        for k, v in self.remote.total_recv.items()
+                    ),
+                ]
             )
         except:
             pass
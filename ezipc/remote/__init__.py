@@ -9,27 +9,29 @@ from asyncio import (
     Future,
     gather,
     IncompleteReadError,
-    Queue,
+    Semaphore,
     StreamReader,
     StreamWriter,
     Task,
     wait_for,
 )
-from collections import Counter
+from collections.abc import MutableMapping
 from datetime import datetime as dt
-from functools import partial
 from inspect import isawaitable
 from json import JSONDecodeError
 from secrets import randbits
+from socket import IPPROTO_TCP, TCP_NODELAY
 from typing import (
+    Any,
     AsyncGenerator,
     Awaitable,
     Callable,
     Dict,
     Generator,
-    List,
+    Iterator,
     Optional,
     overload,
+    Set,
     TypeVar,
     Union,
 )
@@ -41,6 +43,7 @@ from ..util.output import (
     hl_method,
     hl_remote,
     hl_rtype,
+    P,
     res_bad,
     res_good,
     warn,
@@ -51,6 +54,7 @@ from .handlers import rpc_response, notif_handler, request_handler, response_han
 from .protocol import (
     Batch,
     Error,
+    from_params,
     JRPC,
     Message,
     Notification,
@@ -58,16 +62,60 @@ from .protocol import (
     Response,
 )
 
-
-counter = lambda: Counter(byte=0, notif=0, request=0, response=0)
 TV = TypeVar("TV", bound=Callable)
 
 
+class Stats(MutableMapping):
+    """Running Totals of the Bytes and Messages sent or received by a Remote.
+
+    The Totals are kept in Slots, to be cheaply incremented as Attributes, but
+        can still be read and written by Key, like the Counter this replaces.
+        The Keys themselves are fixed, and cannot be deleted.
+    """
+
+    __slots__ = ("byte", "notif", "request", "response")
+
+    def __init__(self):
+        self.byte: int = 0
+        self.notif: int = 0
+        self.request: int = 0
+        self.response: int = 0
+
+    def __getitem__(self, key: str) -> int:
+        if key in self.__slots__:
+            return getattr(self, key)
+        else:
+            raise KeyError(key)
+
+    def __setitem__(self, key: str, value: int) -> None:
+        if key in self.__slots__:
+            setattr(self, key, value)
+        else:
+            raise KeyError(key)
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError(f"{type(self).__name__} Keys are fixed, and cannot be deleted.")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def __iadd__(self, other: "Stats") -> "Stats":
+        self.byte += other.byte
+        self.notif += other.notif
+        self.request += other.request
+        self.response += other.response
+        return self
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v}" for k, v in self.items())
+        return f"{type(self).__name__}({fields})"
+
+
 def mkid(remote: "Remote") -> str:
-    return format(
-        (uuid4().int + remote.port + sum(map(int, remote.addr.split(".")))) % 0x1000,
-        "0>3X",
-    )
+    return format((uuid4().int + remote.port + remote.addr_sum) & 0xFFF, "0>3X")
 
 
 class Remote:
@@ -77,6 +125,10 @@ class Remote:
     Initialized with an Async Event Loop, and the Reader and Writer of a Stream,
     the Remote class provides a clean interface for reception and transmission
     of data to a Remote Host.
+
+    The Remote does not own its Event Loop, and does not change how it schedules
+    Tasks. To run Hooks eagerly, install the eager Task Factory on the Loop
+    before creating the Remote.
     """
 
     __slots__ = (
@@ -85,18 +137,21 @@ class Remote:
         "outstr",
         "connection",
         "addr",
+        "addr_sum",
         "port",
         "hooks_notif",
         "hooks_notif_inher",
         "hooks_request",
         "hooks_request_inher",
         "futures",
-        "lines",
+        "_dispatch",
         "total_sent",
         "total_recv",
         "group",
         "rtype",
-        "id",
+        "_id",
+        "_repr",
+        "_str",
         "opened",
         "startup",
     )
@@ -110,16 +165,38 @@ class Remote:
         *,
         rtype: str = "Remote",
         remote_id: str = None,
+        read_size: int = 1 << 16,
+        max_frame: int = 1 << 16,
     ):
         self.eventloop: AbstractEventLoop = eventloop
+
         self.instr: StreamReader = instr
         self.outstr: StreamWriter = outstr
-        self.connection: Connection = Connection(instr, outstr)
+        self.connection: Connection = Connection(
+            instr, outstr, read_size=read_size, max_frame=max_frame
+        )
+
+        sock = self.outstr.get_extra_info("socket")
+        if sock is not None:
+            # Messages are small and latency-sensitive; Do not let Nagle's
+            #   Algorithm hold them back.
+            try:
+                sock.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+            except OSError:
+                # Not a TCP Socket.
+                pass
 
         ap = self.outstr.get_extra_info("peername", ("0.0.0.0", 0))
         self.addr: str = ap[0]
         self.port: int = ap[1]
 
+        try:
+            # Used in the generation of IDs. Compute it only once.
+            self.addr_sum: int = sum(map(int, self.addr.split(".")))
+        except ValueError:
+            # Not an IPv4 Address.
+            self.addr_sum: int = 0
+
         self.hooks_notif: Dict[str, Callable] = {}
         self.hooks_notif_inher: Dict[str, Callable] = {}
 
@@ -128,9 +205,15 @@ class Remote:
 
         self.futures: Dict[str, Future] = {}
 
-        self.lines: Queue = Queue()
-        self.total_sent: Counter = counter()
-        self.total_recv: Counter = counter()
+        # Map each Message Type to the Method that processes it.
+        self._dispatch: Dict[type, Callable[[Message], Any]] = {
+            Response: self._process_response,
+            Request: self._process_request,
+            Notification: self._process_notif,
+        }
+
+        self.total_sent: Stats = Stats()
+        self.total_recv: Stats = Stats()
 
         self.group: set = group
         self.rtype: str = rtype
@@ -153,11 +236,23 @@ class Remote:
     def open(self) -> bool:
         return self.connection.open
 
+    @property
+    def id(self) -> str:
+        return self._id
+
+    @id.setter
+    def id(self, value: str) -> None:
+        # Both String forms are used in nearly every Message logged. Render
+        #   them only when the ID changes.
+        self._id: str = value
+        self._repr: str = f"{self.rtype} {value}"
+        self._str: str = hl_rtype(f"{self.rtype} {hl_remote(value)}")
+
     def __repr__(self) -> str:
-        return f"{self.rtype} {self.id}"
+        return self._repr
 
     def __str__(self) -> str:
-        return hl_rtype(f"{self.rtype} {hl_remote(self.id)}")
+        return self._str
 
     def _add_hooks(self) -> None:
         """Add the initial hooks for the connection: Ping, and the two hooks
@@ -226,88 +321,20 @@ class Remote:
         waiting for it and set its Result. Otherwise, find a Hook waiting for
         the Method received, and run it.
         """
-        if isinstance(msg, Response):
-            # Message is a RESPONSE.
-            self.total_recv["response"] += 1
-            if msg.id in self.futures:
-                # Something is waiting for this message.
-                future: Future = self.futures.pop(msg.id)
-
-                if future.cancelled():
-                    warn(
-                        f"Received a Response from {self!r} for a cancelled Future."
-                        f" UUID: {msg.id}"
-                    )
-                elif future.done():
-                    warn(
-                        f"Received a Response from {self!r} for a closed Future."
-                        f" UUID: {msg.id}"
-                    )
-                else:
-                    # We need to fulfill this Future now.
-                    echo("recv", f"Receiving a Response from {self}.")
-
-                    if msg.error:
-                        # Server sent an Error Response. Forward it to the Future.
-                        future.set_exception(msg.error.as_exception())
-                    else:
-                        # Server sent a Result Response. Give it to the Future.
-                        future.set_result(msg.result)
+        # Anything that is not a valid JSON-RPC structure will not be found,
+        #   and is ignored.
+        processor = self._dispatch.get(type(msg))
+        if processor is None:
+            # Not an exact match. Fall back on checking for Subclasses, in the
+            #   same Order as the Dispatch Table.
+            for mtype, proc in self._dispatch.items():
+                if isinstance(msg, mtype):
+                    processor = proc
+                    break
             else:
-                # Nothing is waiting for this message. Make a note and move on.
-                warn(f"Received an unsolicited Response for {self!r}. UUID: {msg.id}")
-
-        elif isinstance(msg, Request):
-            # Message is a REQUEST.
-            self.total_recv["request"] += 1
+                return None
 
-            hooks = self.hooks_request.copy()
-            hooks.update(self.hooks_request_inher)
-
-            if msg.method in hooks:
-                # We know where to send this type of Request.
-                echo("recv", f"Receiving {hl_method(msg.method)} Request from {self}.")
-                try:
-                    return hooks[msg.method](msg, self)
-                except Exception as e:
-                    warn(f"Unknown Error on {msg.method!r} Request from {self!r}:", e)
-                    return e
-            else:
-                # We have no hook for this method; Return an Error.
-                warn(f"Receiving invalid {msg.method} Request from {self!r}.")
-                return msg.response(error=Error.method_not_found(msg.method))
-
-        elif isinstance(msg, Notification):
-            # Message is a NOTIFICATION.
-            self.total_recv["notif"] += 1
-
-            hooks = self.hooks_notif.copy()
-            hooks.update(self.hooks_notif_inher)
-
-            if msg.method == "TERM":
-                # The connection is being explicitly terminated.
-                echo("recv", f"Receiving TERMINATE from {self}.")
-                raise ConnectionResetError(
-                    msg.params["reason"] or "Connection terminated by peer."
-                )
-            elif msg.method in hooks:
-                # We know where to send this type of Notification.
-                echo(
-                    "recv",
-                    f"Receiving {hl_method(msg.method)} Notification from {self}.",
-                )
-                try:
-                    return hooks[msg.method](msg, self)
-                except Exception as e:
-                    warn(
-                        f"Unknown Error on {msg.method!r} Notification from {self!r}:",
-                        e,
-                    )
-                    return e
-            else:
-                # We have no hook for this method; Return an Error.
-                warn(f"Receiving invalid {msg.method} Notification from {self!r}.")
-                # return Response(msg, error=Error.method_not_found(msg.method))
+        return processor(msg)
 
         # else:
         #     # Message is not a valid JSON-RPC structure. If we can find an ID,
@@ -318,6 +345,95 @@ class Remote:
         #             msg, error=Error.invalid_request(list(dict(msg).keys()))
         #         )
 
+    def _process_response(self, msg: Response) -> None:
+        """Message is a RESPONSE."""
+        self.total_recv.response += 1
+        if msg.id in self.futures:
+            # Something is waiting for this message.
+            future: Future = self.futures.pop(msg.id)
+
+            if future.cancelled():
+                warn(
+                    f"Received a Response from {self!r} for a cancelled Future."
+                    f" UUID: {msg.id}"
+                )
+            elif future.done():
+                warn(
+                    f"Received a Response from {self!r} for a closed Future."
+                    f" UUID: {msg.id}"
+                )
+            else:
+                # We need to fulfill this Future now.
+                if P.enabled("recv"):
+                    echo("recv", f"Receiving a Response from {self}.")
+
+                if msg.error:
+                    # Server sent an Error Response. Forward it to the Future.
+                    future.set_exception(msg.error.as_exception())
+                else:
+                    # Server sent a Result Response. Give it to the Future.
+                    future.set_result(msg.result)
+        else:
+            # Nothing is waiting for this message. Make a note and move on.
+            warn(f"Received an unsolicited Response for {self!r}. UUID: {msg.id}")
+
+    def _process_request(self, msg: Request) -> Optional[Union[Exception, Response]]:
+        """Message is a REQUEST."""
+        self.total_recv.request += 1
+
+        # Inherited Hooks take precedence over our own. Look them up directly,
+        #   rather than merging copies of both for every Message.
+        hook = self.hooks_request_inher.get(msg.method) or self.hooks_request.get(
+            msg.method
+        )
+
+        if hook is not None:
+            # We know where to send this type of Request.
+            if P.enabled("recv"):
+                echo("recv", f"Receiving {hl_method(msg.method)} Request from {self}.")
+            try:
+                return hook(msg, self)
+            except Exception as e:
+                warn(f"Unknown Error on {msg.method!r} Request from {self!r}:", e)
+                return e
+        else:
+            # We have no hook for this method; Return an Error.
+            warn(f"Receiving invalid {msg.method} Request from {self!r}.")
+            return msg.response(error=Error.method_not_found(msg.method))
+
+    def _process_notif(self, msg: Notification) -> Optional[Exception]:
+        """Message is a NOTIFICATION."""
+        self.total_recv.notif += 1
+
+        hook = self.hooks_notif_inher.get(msg.method) or self.hooks_notif.get(
+            msg.method
+        )
+
+        if msg.method == "TERM":
+            # The connection is being explicitly terminated.
+            echo("recv", f"Receiving TERMINATE from {self}.")
+            raise ConnectionResetError(
+                msg.params["reason"] or "Connection terminated by peer."
+            )
+        elif hook is not None:
+            # We know where to send this type of Notification.
+            if P.enabled("recv"):
+                echo(
+                    "recv",
+                    f"Receiving {hl_method(msg.method)} Notification from {self}.",
+                )
+            try:
+                return hook(msg, self)
+            except Exception as e:
+                warn(
+                    f"Unknown Error on {msg.method!r} Notification from {self!r}:", e,
+                )
+                return e
+        else:
+            # We have no hook for this method; Return an Error.
+            warn(f"Receiving invalid {msg.method} Notification from {self!r}.")
+            # return Response(msg, error=Error.method_not_found(msg.method))
+
     def hook_notif(self, method: str):
         """Signal to the Remote that `func` is waiting for Notifications of the
             provided `method` value.
@@ -337,192 +453,161 @@ class Remote:
         return request_handler(self.hooks_request, method)
 
     def close(self) -> None:
-        self.total_recv["byte"] = self.connection.total_recv
-        self.total_sent["byte"] = self.connection.total_sent
+        self.total_recv.byte = self.connection.total_recv
+        self.total_sent.byte = self.connection.total_sent
         self.connection.close()
 
         if self.group is not None and self in self.group:
             # Remove self from Client Set, if possible.
             self.group.remove(self)
 
-    async def run_helpers(self, count: int) -> None:
-        """Spawn and manage Helper Tasks."""
-        helpers: List[Task] = []
-
-        async def _helper():
-            """Repeatedly, forever, read a line from the Input Queue and put it
-                through the Processor. Provide a List to be filled with Tasks.
-                Then, when the Processing Coroutine finishes, Gather and Await
-                all the Tasks, if any, that have since accrued.
-            """
-            while line := await self.lines.get():
-                try:
-                    data = {
-                        msg: self.process_message(msg) for msg in (JRPC.decode(line))
-                    }
-
-                except JSONDecodeError as e:
-                    warn(f"Invalid JSON received from {self!r}.")
-                    await self.respond(None, err=Error.parse_error(str(e)))
-                except UnicodeDecodeError:
-                    warn(f"Corrupt data received from {self!r}.")
-
-                except CancelledError:
-                    raise
-
-                except ConnectionError as e:
-                    # Whatever just happened was too much to just die calmly.
-                    #   Close down the entire Remote.
-                    if self.open:
-                        self.close()
-                        echo("dcon", f"Connection with {self} closed: {e}")
+    async def process_line(self, line: bytes) -> None:
+        """Put every Message in a Line through the Processor. Gather and Await
+            all the Tasks, if any, that the Processor returns, and then send back
+            a Batch of all the Responses.
+        """
+        try:
+            data = {msg: self.process_message(msg) for msg in JRPC.decode(line)}
 
-                except Exception as e:
-                    err_("Unknown Exception:", e)
-                    raise e
+        except UnicodeDecodeError:
+            warn(f"Corrupt data received from {self!r}.")
+        except (JSONDecodeError, ValueError) as e:
+            # Alternative JSON Parsers raise their own subclasses of
+            #   ValueError, not necessarily of JSONDecodeError.
+            warn(f"Invalid JSON received from {self!r}.")
+            await self.respond(None, err=Error.parse_error(str(e)))
 
-                else:
-                    responses: Batch = Batch()
-                    tasks: Dict[Message, Awaitable] = {}
-
-                    for recv, tsk in data.items():
-                        # Loop through the Processors of all Data received.
-                        if isinstance(tsk, Response):
-                            # If the Processor returned a Response, add it to
-                            #   the Batch.
-                            responses.append(tsk)
-
-                        elif isinstance(tsk, (dict, list, tuple)):
-                            # If the Processor returned something that can be
-                            #   made into a Response, do it and add it.
-                            if isinstance(recv, Request):
-                                responses.append(recv.response(result=tsk))
-
-                        elif isinstance(tsk, Exception):
-                            # If it returned an Exception, wrap it in an Error
-                            #   and add it.
-                            if isinstance(recv, Request):
-                                responses.append(
-                                    recv.response(error=Error.from_exception(tsk))
-                                )
-
-                        elif isawaitable(tsk):
-                            # If it can be Awaited, add it as a Task.
-                            tasks[recv] = tsk
-
-                        elif isinstance(tsk, AsyncGenerator):
-                            # If it is an Async Generator, this means that the
-                            #   Processor will Yield something, and then it has
-                            #   some cleanup afterwards. Add the ANext as a
-                            #   Task.
-                            tasks[recv] = tsk.__anext__()
-
-                        elif isinstance(tsk, Generator):
-                            # If it is a Sync Generator, same deal; However, it
-                            #   must be wrapped in a Task first.
-                            async def _n():
-                                return next(tsk)
-
-                            tasks[recv] = _n()
-
-                        elif isinstance(recv, Request):
-                            # Anything else is wrapped within a List.
-                            responses.append(
-                                recv.response(result=[] if tsk is None else [tsk])
-                            )
-
-                    # Gather and Await all the Tasks.
-                    finals = dict(
-                        zip(
-                            tasks.keys(),
-                            await gather(*tasks.values(), return_exceptions=True),
-                        )
-                    )
+        except CancelledError:
+            raise
 
-                    for recv, ret in finals.items():
-                        # Add the Responses of the Tasks to the Batch.
-                        if isinstance(ret, Response):
-                            # All native Responses are added directly.
-                            responses.append(ret)
-
-                        elif isinstance(ret, (dict, list, tuple)):
-                            # Structures are wrapped and Added...IF the original
-                            #   Message was a Request.
-                            if isinstance(recv, Request):
-                                responses.append(recv.response(result=ret))
-
-                        elif isinstance(ret, Exception):
-                            # Exceptions are again wrapped in Errors.
-                            if isinstance(recv, Request):
-                                responses.append(
-                                    recv.response(error=Error.from_exception(ret))
-                                )
-
-                        elif isinstance(recv, Request):
-                            # Anything else is wrapped within a List.
-                            responses.append(
-                                recv.response(result=[] if ret is None else [ret])
-                            )
-
-                    # # # SEND THE BATCH # # #
-                    if responses:
-                        await self.send_batch(responses)
-                    # # # ============== # # #
-
-                    # Now, handle any Cleanup required by Generators.
-                    for original in data.values():
-                        if isinstance(original, AsyncGenerator):
-                            async for _ in original:
-                                pass
-                        elif isinstance(original, Generator):
-                            for _ in original:
-                                pass
-
-                finally:
-                    self.lines.task_done()
-
-        new = lambda: self.eventloop.create_task(_helper())
-
-        def revive():
-            for i, h in enumerate(helpers):
-                if h.done():
-                    # Replace all Helpers that have stopped.
-                    e = h.exception()
-                    if e is None:
-                        err_(f"A Helper Task in {self!r} has died.")
-                    else:
-                        err_(f"A Helper Task in {self!r} has died to an Exception:", e)
-                    helpers[i] = new()
+        except ConnectionError as e:
+            # Whatever just happened was too much to just die calmly. Close down
+            #   the entire Remote.
+            if self.open:
+                self.close()
+                echo("dcon", f"Connection with {self} closed: {e}")
 
-        try:
-            # Create Tasks.
-            for _ in range(count):
-                helpers.append(new())
+        except Exception as e:
+            err_("Unknown Exception:", e)
 
-            # Loop "forever", waiting for one to Raise. Note that we do NOT pass
-            #   ``return_exceptions`` to these ``gather()``s.
-            while True:
+        else:
+            responses: Batch = Batch()
+            tasks: Dict[Message, Awaitable] = {}
+
+            for recv, tsk in data.items():
+                # Loop through the Processors of all Data received.
+                if isinstance(tsk, Response):
+                    # If the Processor returned a Response, add it to the Batch.
+                    responses.append(tsk)
+
+                elif isinstance(tsk, (dict, list, tuple)):
+                    # If the Processor returned something that can be made into
+                    #   a Response, do it and add it.
+                    if isinstance(recv, Request):
+                        responses.append(recv.response(result=tsk))
+
+                elif isinstance(tsk, Exception):
+                    # If it returned an Exception, wrap it in an Error and add
+                    #   it.
+                    if isinstance(recv, Request):
+                        responses.append(recv.response(error=Error.from_exception(tsk)))
+
+                elif isawaitable(tsk):
+                    # If it can be Awaited, add it as a Task.
+                    tasks[recv] = tsk
+
+                elif isinstance(tsk, AsyncGenerator):
+                    # If it is an Async Generator, this means that the Processor
+                    #   will Yield something, and then it has some cleanup
+                    #   afterwards. Add the ANext as a Task.
+                    tasks[recv] = tsk.__anext__()
+
+                elif isinstance(tsk, Generator):
+                    # If it is a Sync Generator, same deal; However, it must be
+                    #   wrapped in a Task first.
+                    async def _n():
+                        return next(tsk)
+
+                    tasks[recv] = _n()
+
+                elif isinstance(recv, Request):
+                    # Anything else is wrapped within a List.
+                    responses.append(recv.response(result=[] if tsk is None else [tsk]))
+
+            if len(tasks) == 1:
+                # Only one thing to Await, which is the usual case. Await it
+                #   here, rather than wrapping it in a Task to be Gathered.
+                ((recv, aw),) = tasks.items()
                 try:
-                    await gather(*helpers)
-                except CancelledError:
-                    # If this is Cancelled, break the loop and stop all Helpers.
-                    break
-                except:
-                    # On any other Exception, ignore it and revive dead Helpers.
-                    revive()
-        finally:
-            # Kill Tasks.
-            g = gather(*helpers, return_exceptions=True)
+                    ret = await aw
+                except Exception as e:
+                    ret = e
+                finals = {recv: ret}
+            else:
+                # Gather and Await all the Tasks.
+                finals = dict(
+                    zip(
+                        tasks.keys(),
+                        await gather(*tasks.values(), return_exceptions=True),
+                    )
+                )
 
-            if g.cancel():
-                await g
+            for recv, ret in finals.items():
+                # Add the Responses of the Tasks to the Batch.
+                if isinstance(ret, Response):
+                    # All native Responses are added directly.
+                    responses.append(ret)
+
+                elif isinstance(ret, (dict, list, tuple)):
+                    # Structures are wrapped and Added...IF the original Message
+                    #   was a Request.
+                    if isinstance(recv, Request):
+                        responses.append(recv.response(result=ret))
+
+                elif isinstance(ret, Exception):
+                    # Exceptions are again wrapped in Errors.
+                    if isinstance(recv, Request):
+                        responses.append(recv.response(error=Error.from_exception(ret)))
+
+                elif isinstance(recv, Request):
+                    # Anything else is wrapped within a List.
+                    responses.append(recv.response(result=[] if ret is None else [ret]))
+
+            # # # SEND THE BATCH # # #
+            if responses:
+                await self.send_batch(responses)
+            # # # ============== # # #
+
+            # Now, handle any Cleanup required by Generators.
+            for original in data.values():
+                if isinstance(original, AsyncGenerator):
+                    async for _ in original:
+                        pass
+                elif isinstance(original, Generator):
+                    for _ in original:
+                        pass
 
     async def loop(self, helper_count: int = 5) -> None:
-        """Listen on the Connection, and write data from it into the Queue to be
-        handled by Helper Tasks.
+        """Listen on the Connection, and hand each Line received from it to a
+        new Task to be processed. No more than ``helper_count`` Lines will be
+        processed at the same time.
         """
-        # Create a Task that creates Tasks.
-        helper_runner = self.eventloop.create_task(self.run_helpers(helper_count))
+        limit: Semaphore = Semaphore(helper_count)
+        live: Set[Task] = set()
+
+        create_task = self.eventloop.create_task
+        process = self.process_line
+
+        def finished(task: Task) -> None:
+            live.discard(task)
+            limit.release()
+
+            # Anything raised after the Messages were processed, such as while
+            #   sending the Responses or cleaning up Generators, ends up here.
+            if not task.cancelled():
+                e = task.exception()
+                if e is not None:
+                    err_(f"A Line Task in {self!r} has died to an Exception:", e)
 
         try:
             async for item in self.connection:
@@ -531,17 +616,11 @@ class Remote:
                     # If we received an Exception, the Decryption failed.
                     warn(f"Decryption from {self!r} failed:", item)
                 else:
-                    # Otherwise, add it to the Queue.
-                    await self.lines.put(item)
-
-                # Double check that we are still listening.
-                if helper_runner.done():
-                    # Helper Helper has ended, for some reason.
-                    e = helper_runner.exception()
-                    if e:
-                        raise e
-                    else:
-                        break
+                    # Otherwise, wait for a free slot and process it.
+                    await limit.acquire()
+                    task = create_task(process(item))
+                    live.add(task)
+                    task.add_done_callback(finished)
 
         except IncompleteReadError:
             if self.open:
@@ -561,8 +640,12 @@ class Remote:
 
         finally:
             self.close()
-            if helper_runner.cancel():
-                await helper_runner
+            if live:
+                # Kill Tasks.
+                pending = tuple(live)
+                for task in pending:
+                    task.cancel()
+                await gather(*pending, return_exceptions=True)
 
     async def notif(
         self,
@@ -572,20 +655,32 @@ class Remote:
         quiet: bool = False,
     ) -> None:
         """Assemble and send a JSON-RPC Notification with the given data."""
+        if self.open:
+            await self.notif_message(
+                from_params(Notification, meth, params), nohandle=nohandle, quiet=quiet
+            )
+
+    async def notif_message(
+        self,
+        msg: Notification,
+        encoded: Union[str, bytes] = None,
+        *,
+        nohandle: bool = False,
+        quiet: bool = False,
+    ) -> None:
+        """Send an already assembled JSON-RPC Notification. If the Notification
+            has also already been serialized, as when the same Message is sent
+            to many Remotes, the serialized form may be passed in as well.
+        """
         if not self.open:
             return
 
-        if not quiet:
-            echo("send", f"Sending {hl_method(meth)} Notification to {self}.")
+        if not quiet and P.enabled("send"):
+            echo("send", f"Sending {hl_method(msg.method)} Notification to {self}.")
 
         try:
-            self.total_sent["notif"] += 1
-            if isinstance(params, dict):
-                await self.send(Notification(meth, **params))
-            elif isinstance(params, (list, tuple)):
-                await self.send(Notification(meth, *params))
-            else:
-                await self.send(Notification(meth))
+            self.total_sent.notif += 1
+            await self.send(msg, encoded)
         except Exception as e:
             err_("Failed to send Notification:", e)
             if nohandle:
@@ -629,6 +724,29 @@ class Remote:
         """Assemble a JSON-RPC Request with the given data. Send the Request,
             and return a Future to represent the eventual result.
         """
+        return await self.request_message(
+            from_params(Request, meth, params, mid=self._id_new()),
+            callback=callback,
+            nohandle=nohandle,
+            quiet=quiet,
+            timeout=timeout,
+        )
+
+    async def request_message(
+        self,
+        req: Request,
+        encoded: Union[str, bytes] = None,
+        *,
+        callback: Callable = None,
+        nohandle: bool = False,
+        quiet: bool = False,
+        timeout: float = 0,
+    ) -> Union[Union[dict, list], Future]:
+        """Send an already assembled JSON-RPC Request, and return a Future to
+            represent the eventual result. If the Request has also already been
+            serialized, as when the same Message is sent to many Remotes, the
+            serialized form may be passed in as well.
+        """
         # Create a Future which will represent the Response.
         future: Future = self.eventloop.create_future()
 
@@ -636,26 +754,22 @@ class Remote:
             future.set_exception(ConnectionResetError)
             return future
 
-        if not quiet:
-            echo("send", f"Sending {hl_method(meth)} Request to {self}.")
-        self.total_sent["request"] += 1
-
-        if isinstance(params, dict):
-            req = Request(meth, **params, mid=self._id_new())
-        elif isinstance(params, (list, tuple)):
-            req = Request(meth, *params, mid=self._id_new())
-        else:
-            req = Request(meth, mid=self._id_new())
+        if not quiet and P.enabled("send"):
+            echo("send", f"Sending {hl_method(req.method)} Request to {self}.")
+        self.total_sent.request += 1
 
         self.futures[req.id] = future
 
         if callback:
-            cb = partial(callback, remote=self)
-            # noinspection PyTypeChecker
+            # Bind the Callback and the Remote as Defaults; A Partial with a
+            #   Keyword would allocate a new Dict for every Request.
+            def cb(fut: Future, _callback=callback, _remote=self):
+                _callback(fut, remote=_remote)
+
             future.add_done_callback(cb)
 
         try:
-            await self.send(req)
+            await self.send(req, encoded)
         except Exception as e:
             err_("Failed to send Request:", e)
             if nohandle:
@@ -676,15 +790,16 @@ class Remote:
         nohandle: bool = False,
     ) -> None:
         if self.open:
-            echo(
-                "send",
-                "Sending {} Response{} to {}.".format(
-                    res_bad("Error") if err else res_good("Result"),
-                    f" for {hl_method(method)}" if method else "",
-                    self,
-                ),
-            )
-            self.total_sent["response"] += 1
+            if P.enabled("send"):
+                echo(
+                    "send",
+                    "Sending {} Response{} to {}.".format(
+                        res_bad("Error") if err else res_good("Result"),
+                        f" for {hl_method(method)}" if method else "",
+                        self,
+                    ),
+                )
+            self.total_sent.response += 1
             try:
                 await self.send(
                     Response(mid, error=err) if err else Response(mid, result=res)
@@ -695,15 +810,16 @@ class Remote:
                 if nohandle:
                     raise e
 
-    async def send(self, msg: Message) -> int:
+    async def send(self, msg: Message, encoded: Union[str, bytes] = None) -> int:
         if self.open:
-            return await self.connection.write(str(msg))
+            data = msg.encode() if encoded is None else encoded
+            return await self.connection.write(data)
         else:
             return 0
 
     async def send_batch(self, batch: Batch) -> int:
         if batch and self.open:
-            return await self.connection.write(batch.json())
+            return await self.connection.write(batch.encode())
         else:
             return 0
 
@@ -1,6 +1,7 @@
-from asyncio import StreamReader, StreamWriter
+from asyncio import IncompleteReadError, LimitOverrunError, StreamReader, StreamWriter
 from base64 import b85decode as dearmor, b85encode as armor
-from typing import List, Optional, Union
+from collections import deque
+from typing import Deque, List, Optional, Union
 
 try:
     # noinspection PyPackageRequirements
@@ -42,6 +43,10 @@ class Connection:
         "instr",
         "outstr",
         "encoding",
+        "read_size",
+        "max_frame",
+        "frames",
+        "buffer",
         "can_encrypt",
         "open",
         "_key_priv",
@@ -55,12 +60,29 @@ class Connection:
     )
 
     def __init__(
-        self, instr: StreamReader, outstr: StreamWriter, *, encoding: str = "utf-8",
+        self,
+        instr: StreamReader,
+        outstr: StreamWriter,
+        *,
+        encoding: str = "utf-8",
+        read_size: int = 1 << 16,
+        max_frame: int = 1 << 16,
     ):
         self.instr: StreamReader = instr
         self.outstr: StreamWriter = outstr
         self.encoding: str = encoding
 
+        # Data is read from the Stream in Chunks of up to this many Bytes. All
+        #   complete Frames in a Chunk are queued up at once, and any incomplete
+        #   Frame at the end is kept in the Buffer until the rest of it arrives.
+        #   The same Buffer is reused for the whole life of the Connection.
+        self.read_size: int = read_size
+        # An incomplete Frame may not grow past this many Bytes, so that a
+        #   Peer cannot make the Buffer grow without end.
+        self.max_frame: int = max_frame
+        self.frames: Deque[bytearray] = deque()
+        self.buffer: bytearray = bytearray()
+
         self.can_encrypt: bool = can_encrypt
         self.open: bool = True
 
@@ -91,7 +113,7 @@ class Connection:
             else None
         )
 
-    def _decode(self, bytes_cipher: bytes) -> str:
+    def _decode(self, bytes_cipher: bytes) -> bytes:
         if self.encrypted:
             bytes_plain: bytes = self.box.decrypt(dearmor(bytes_cipher))
             if self.key_other_ver:
@@ -99,10 +121,16 @@ class Connection:
         else:
             bytes_plain = dearmor(bytes_cipher)
 
-        return bytes_plain.decode(self.encoding)
+        # Left undecoded; The JSON Parser handles UTF-8 itself.
+        return bytes_plain
 
-    def _encode(self, str_plain: str) -> bytes:
-        bytes_plain: bytes = str_plain.encode(self.encoding)
+    def _encode(self, str_plain: Union[str, bytes]) -> bytes:
+        # Text may arrive already encoded, as from orjson, which produces UTF-8.
+        bytes_plain: bytes = (
+            str_plain
+            if isinstance(str_plain, bytes)
+            else str_plain.encode(self.encoding)
+        )
 
         if self.encrypted:
             if self._key_sign:
@@ -138,16 +166,52 @@ class Connection:
     def encryption_ready(self) -> bool:
         return bool(self._box and self._box is not self.box)
 
-    async def read(self) -> str:
-        ctext: bytes = await self.instr.readuntil(sep)
-        self.total_recv += len(ctext)
-        ptext: str = self._decode(ctext[: -len(sep)])
+    def _drain_chunk(self, chunk: bytes) -> None:
+        """Add a Chunk of Data read from the Stream to the Buffer, and split it
+            into Frames in one pass. Queue all of the complete Frames, and leave
+            the trailing remainder in the Buffer.
+        """
+        buf = self.buffer
+        # Only the new Data, and the tail of the old, can hold a new Separator.
+        start = max(0, len(buf) - len(sep) + 1)
+        buf += chunk
+
+        end = buf.rfind(sep, start)
+        if end != -1:
+            frames = buf[:end].split(sep)
+            for frame in frames:
+                if len(frame) > self.max_frame:
+                    raise LimitOverrunError(
+                        "Separator is found, but chunk is longer than limit",
+                        len(frame),
+                    )
+
+            self.frames.extend(frames)
+            del buf[: end + len(sep)]
+
+        if len(buf) > self.max_frame:
+            raise LimitOverrunError(
+                "Separator is not found, and chunk exceed the limit", len(buf)
+            )
+
+    async def read(self) -> bytes:
+        while not self.frames:
+            # Only touch the Stream when no complete Frames are left over.
+            chunk: bytes = await self.instr.read(self.read_size)
+            if not chunk:
+                raise IncompleteReadError(bytes(self.buffer), None)
+
+            self.total_recv += len(chunk)
+            self._drain_chunk(chunk)
+
+        ptext: bytes = self._decode(self.frames.popleft())
         return ptext
 
-    async def write(self, ptext: str) -> int:
+    async def write(self, ptext: Union[str, bytes]) -> int:
         ctext: bytes = self._encode(ptext)
-        self.outstr.write(ctext)
-        self.outstr.write(sep)
+        # Hand the Frame and its Separator to the Transport together. Where
+        #   possible, it sends them in one call without joining them first.
+        self.outstr.writelines((ctext, sep))
 
         count = len(ctext) + len(sep)
         self.total_sent += count
@@ -158,9 +222,9 @@ class Connection:
     def __aiter__(self):
         return self
 
-    async def __anext__(self) -> Union[CryptoError, str]:
+    async def __anext__(self) -> Union[CryptoError, bytes]:
         try:
-            line: str = await self.read()
+            line: bytes = await self.read()
             if line and self.open:
                 return line
             else:
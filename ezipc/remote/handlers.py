@@ -53,6 +53,9 @@ def notif_handler(hooks: Dict[str, Callable], method: str) -> Callable:
         :rtype: Callable[[Union[dict, list], Remote], Callable]
         """
 
+        # Inspect the Signature once, here, rather than on every call.
+        pass_remote: bool = len(signature(func).parameters) > 1
+
         @wraps(func)
         def handle_notif(notif: Notification, remote: Remote):
             """Given Data and a Remote, execute the Function provided above,
@@ -63,7 +66,7 @@ def notif_handler(hooks: Dict[str, Callable], method: str) -> Callable:
             :param Remote remote: A Remote Object representing the IPC interface
                 to another, possibly non-local, Process.
             """
-            if len(signature(func).parameters) > 1:
+            if pass_remote:
                 return func(notif.params, remote)
             else:
                 return func(notif.params)
@@ -104,6 +107,9 @@ def request_handler(hooks: Dict[str, Callable], method: str) -> Callable:
         :rtype: Callable[[Union[dict, list], Remote], Callable]
         """
 
+        # Inspect the Signature once, here, rather than on every call.
+        pass_remote: bool = len(signature(func).parameters) > 1
+
         @wraps(func)
         def handle_request(request: Request, remote: Remote):
             """Given Data and a Remote, execute the Function provided above,
@@ -114,7 +120,7 @@ def request_handler(hooks: Dict[str, Callable], method: str) -> Callable:
             :param Remote remote: A Remote Object representing the IPC interface
                 to another, possibly non-local, Process.
             """
-            if len(signature(func).parameters) > 1:
+            if pass_remote:
                 return func(request.params, remote)
             else:
                 return func(request.params)
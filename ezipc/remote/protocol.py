@@ -6,10 +6,11 @@ https://www.jsonrpc.org/specification
 
 from abc import ABC, abstractmethod
 from enum import IntEnum
-from json import dumps, loads
+from json import dumps
 from secrets import randbits
 from typing import (
     Any,
+    Callable,
     Dict,
     Final,
     FrozenSet,
@@ -23,12 +24,44 @@ from typing import (
 
 from .exc import RemoteError
 
+try:
+    # noinspection PyPackageRequirements
+    from orjson import loads
+except ImportError:
+    try:
+        # noinspection PyPackageRequirements
+        from ssrjson import loads
+    except ImportError:
+        from json import loads
+
+try:
+    # noinspection PyPackageRequirements
+    from orjson import dumps as _dumps_bytes
+except ImportError:
+    _dumps_bytes = None
+
 
 ID_PRE: str = "NaN"
 JSON_OPTS = {"separators": (",", ":")}
 __version__ = "2.0"
 
 
+def encode(data: Any) -> Union[str, bytes]:
+    """Serialize a Structure to be sent. If orjson is available, it is used to
+        produce UTF-8 Bytes directly, which the Connection will then not need
+        to encode again.
+    """
+    if _dumps_bytes is not None:
+        try:
+            return _dumps_bytes(data)
+        except TypeError:
+            # Some Values are accepted by the standard Library, but not by
+            #   orjson, such as non-String Keys and very large Integers.
+            pass
+
+    return dumps(data, **JSON_OPTS)
+
+
 basic_: FrozenSet[str] = frozenset({"jsonrpc"})
 
 id_: FrozenSet[str] = basic_ | frozenset({"id"})
@@ -134,23 +167,27 @@ class JRPC(IntEnum):
     def check(cls, data: dict) -> "JRPC":
         if data.get("jsonrpc") != __version__:
             return cls.NONE
-        keys = frozenset(data.keys())
 
-        if id_ < keys:
+        # Compare the Key View directly; Building a Set from it for every
+        #   Message is not necessary.
+        keys = data.keys()
+
+        if "id" in data:
             # Either a Request or a Response.
-            if req_sub <= keys <= req_sup:
-                return cls.REQUEST
-            elif res_sub & keys and keys <= res_sup:
+            if "method" in data:
+                if keys <= req_sup:
+                    return cls.REQUEST
+            elif ("result" in data or "error" in data) and keys <= res_sup:
                 return cls.RESPONSE
 
-        elif method_ <= keys <= notif_sup:
+        elif "method" in data and keys <= notif_sup:
             # A Notification.
             return cls.NOTIF
 
         return cls.NONE
 
     @classmethod
-    def decode(cls, line: str) -> Iterator["Message"]:
+    def decode(cls, line: Union[bytes, str]) -> Iterator["Message"]:
         structure = loads(line)
 
         if isinstance(structure, dict):
@@ -161,24 +198,12 @@ class JRPC(IntEnum):
                 mtype = cls.check(msg)
 
                 if mtype is cls.NOTIF:
-                    params = msg.get("params")
-
-                    if isinstance(params, dict):
-                        yield Notification(msg["method"], **params)
-                    elif isinstance(params, list):
-                        yield Notification(msg["method"], *params)
-                    else:
-                        yield Notification(msg["method"])
+                    yield from_params(Notification, msg["method"], msg.get("params"))
 
                 elif mtype is cls.REQUEST:
-                    params = msg.get("params")
-
-                    if isinstance(params, dict):
-                        yield Request(msg["method"], **params, mid=msg["id"])
-                    elif isinstance(params, (list, tuple)):
-                        yield Request(msg["method"], *params, mid=msg["id"])
-                    else:
-                        yield Request(msg["method"], mid=msg["id"])
+                    yield from_params(
+                        Request, msg["method"], msg.get("params"), mid=msg["id"]
+                    )
 
                 elif mtype is cls.RESPONSE:
                     if "error" in msg:
@@ -204,6 +229,12 @@ class Message(ABC):
     def __str__(self) -> str:
         return dumps(dict(self), **JSON_OPTS)
 
+    def encode(self) -> Union[str, bytes]:
+        """Serialize this Message to be sent. Every Message sent goes through
+            here, so that they are all serialized the same way.
+        """
+        return encode(dict(self))
+
 
 class Notification(Message):
     __slots__ = (
@@ -363,6 +394,35 @@ class Response(Message):
         yield "id", self.id
 
 
+# Construct a Message from a Method and a Structure of Params, according to the
+#   exact Type of the Params.
+_makers: Dict[type, Callable[..., Message]] = {
+    dict: lambda cls, method, params, kw: cls(method, **params, **kw),
+    list: lambda cls, method, params, kw: cls(method, *params, **kw),
+    tuple: lambda cls, method, params, kw: cls(method, *params, **kw),
+    type(None): lambda cls, method, _params, kw: cls(method, **kw),
+}
+
+
+def from_params(cls: type, method: str, params: Any = None, **kw) -> Message:
+    """Construct a Notification or Request with the given Method, spreading
+        ``params`` into it as either Keyword or Positional Arguments. Any
+        further Keyword Arguments, such as ``mid``, are passed through.
+    """
+    maker = _makers.get(type(params))
+
+    if maker is None:
+        # Not an exact match. Fall back on checking for Subclasses.
+        if isinstance(params, dict):
+            maker = _makers[dict]
+        elif isinstance(params, (list, tuple)):
+            maker = _makers[list]
+        else:
+            maker = _makers[type(None)]
+
+    return maker(cls, method, params, kw)
+
+
 class Batch(List[Message]):
     def __init__(self, *a):
         super().__init__(a)
@@ -372,3 +432,6 @@ class Batch(List[Message]):
 
     def json(self) -> str:
         return dumps(self.flat(), **JSON_OPTS)
+
+    def encode(self) -> Union[str, bytes]:
+        return encode(self.flat())
@@ -4,29 +4,88 @@ from asyncio import (
     CancelledError,
     Future,
     gather,
-    get_event_loop,
+    get_event_loop_policy,
+    get_running_loop,
     run,
+    set_event_loop_policy,
     start_server,
     StreamReader,
     StreamWriter,
     Task,
 )
-from collections import Counter, MutableSet
+from collections.abc import MutableSet
 from datetime import datetime as dt
+from secrets import randbits
 from socket import AF_INET, SOCK_DGRAM, socket
-from typing import Callable, Dict, Optional, Union
+from typing import Callable, Dict, Optional, Tuple, Union
 
 from .remote import (
     can_encrypt,
-    counter,
     notif_handler,
     Remote,
     RemoteError,
     request_handler,
     rpc_response,
+    Stats,
 )
+from .remote.protocol import from_params, Message, Notification, Request
 from .util import callback_response, echo, err, hl_method, P, T, warn
 
+try:
+    from asyncio import Runner
+except ImportError:
+    # Python < 3.11.
+    Runner = None
+
+try:
+    from asyncio import eager_task_factory
+except ImportError:
+    # Eager Tasks are only available in Python 3.12 and later.
+    eager_task_factory = None
+
+try:
+    # noinspection PyPackageRequirements
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# Broadcast Requests share one ID between all Remotes, so rather than the ID of
+#   any one Remote, their IDs are marked with this.
+ID_BCAST: str = "ALL"
+
+
+def _encode_once(msg: Message) -> Union[str, bytes, None]:
+    """Serialize a Message once, to be sent as-is to any number of Remotes.
+
+    If it cannot be serialized, return `None` instead. Each Remote will then
+        try, and fail, on its own, and report the Error just as it would for a
+        Message sent only to it.
+    """
+    try:
+        return msg.encode()
+    except Exception:
+        return None
+
+
+def _find_addr() -> Optional[str]:
+    """Find the Address of the Interface currently used for outbound Traffic.
+        It is looked up again every time, so that it follows any Change in the
+        Network Configuration.
+    """
+    sock = socket(AF_INET, SOCK_DGRAM)
+    try:
+        # No Packet is sent; Connecting a UDP Socket only selects a Route, and
+        #   does not wait on the Network.
+        sock.connect(("10.255.255.255", 1))
+        addr = sock.getsockname()[0]
+    except (InterruptedError, OSError):
+        return None
+    finally:
+        sock.close()
+
+    return None if addr == "0.0.0.0" else addr
+
 
 __all__ = (
     "callback_response",
@@ -58,19 +117,38 @@ class Server:
     :param bool autopublish: If this is `True`, the Server will try to
         automatically discover the Network Address of the local system. If it
         cannot be found, ``addr`` will be used as a fallback.
-    :param int helpers: The number of Helper Tasks to be used by **each**
-        Remote. More Helpers can be useful when receiving prompts to perform
-        very await-heavy procedures, such as multiple file transfers, but when
-        not in use they mostly sap memory.
+    :param int helpers: The number of Lines that **each** Remote may process
+        at the same time. More Helpers can be useful when receiving prompts to
+        perform very await-heavy procedures, such as multiple file transfers.
+    :param int read_buffer_size: The number of Bytes that **each** Remote may
+        read from its Connection at once. Larger Buffers mean fewer Reads when
+        receiving large Messages, at the cost of memory. This is also the
+        largest Message that a Remote will accept; A Client that sends more
+        than this without ending the Message is disconnected.
+
+    If ``eager_tasks`` is `True` (the default), the eager Task Factory is
+    installed, where available, on the Event Loop that ``start()`` creates. Hooks
+    then begin running as soon as their Tasks are created, so they must not rely
+    on being scheduled later. ``run()`` never changes the Task Factory, as its
+    Loop may belong to the rest of the Program.
+
+    Similarly, if ``use_uvloop`` is `True` (the default) and uvloop is installed,
+    ``start()`` runs the Server in a uvloop Event Loop. Set ``use_uvloop`` to
+    `False` on the Class, or on a Subclass, to opt out.
     """
 
+    eager_tasks: bool = True
+    use_uvloop: bool = True
+
     __slots__ = (
         "addr",
         "port",
         "eventloop",
         "helpers",
+        "read_buffer_size",
         "listeners",
-        "remotes",
+        "_remotes",
+        "_remotes_snapshot",
         "server",
         "startup",
         "total_clients",
@@ -88,17 +166,15 @@ class Server:
         port: int = 9002,
         autopublish: bool = False,
         helpers: int = 5,
+        read_buffer_size: int = 1 << 20,
     ):
         if autopublish:
             # Override the passed parameter and try to autofind the address.
-            sock = socket(AF_INET, SOCK_DGRAM)
-            try:
-                sock.connect(("10.255.255.255", 1))
-                addr = sock.getsockname()[0]
-            except (InterruptedError, OSError):
+            found = _find_addr()
+            if found:
+                addr = found
+            else:
                 warn("Failed to autoconfigure IP address.")
-            finally:
-                sock.close()
 
         if not addr:
             # No Address specified, and autoconfig failed or was not enabled;
@@ -108,22 +184,37 @@ class Server:
         self.addr: str = addr
         self.port: int = port
         self.helpers: int = helpers
+        self.read_buffer_size: int = read_buffer_size
 
         self.eventloop: Optional[AbstractEventLoop] = None
         self.listeners: MutableSet[Task] = set()
-        self.remotes: MutableSet[Remote] = set()
+        # Remotes are kept as the Keys of a Dict, for a stable Order, along with
+        #   a Tuple of them that is only rebuilt when one is added or dropped.
+        self._remotes: Dict[Remote, None] = {}
+        self._remotes_snapshot: Tuple[Remote, ...] = ()
         self.server: Optional[AbstractServer] = None
         self.startup: dt = dt.utcnow()
 
         self.total_clients: int = 0
-        self.total_sent: Counter = counter()
-        self.total_recv: Counter = counter()
+        self.total_sent: Stats = Stats()
+        self.total_recv: Stats = Stats()
 
         self.hooks_notif = {}
         self.hooks_request = {}
         self.hooks_connection = []
         self.hooks_disconnect = []
 
+    @property
+    def remotes(self) -> Tuple[Remote, ...]:
+        """All currently connected Remotes, as a Tuple.
+
+        This used to be the mutable Set of Remotes itself. It is now a read-only
+            Snapshot, which is not affected by later Changes; Use ``add()`` and
+            ``drop()`` to change which Remotes are connected, rather than the
+            ``add()`` and ``discard()`` Methods of the Set.
+        """
+        return self._remotes_snapshot
+
     def setup(self, *_a, **_kw):
         """Execute all prerequisites to running, before running. Meant to be
             extended by Subclasses.
@@ -172,19 +263,23 @@ class Server:
             maps each Remote to its respective sending Task. These Tasks must
             then be awaited.
         """
+        remotes = self._remotes_snapshot
         echo(
             "cast",
-            f"Broadcasting {hl_method(meth)} Notif to {len(self.remotes)}"
-            f" Remote{'' if len(self.remotes) == 1 else 's'}.",
+            f"Broadcasting {hl_method(meth)} Notif to {len(remotes)}"
+            f" Remote{'' if len(remotes) == 1 else 's'}.",
         )
-        if not self.remotes:
+        if not remotes:
             return {}
 
+        # Assemble and serialize the Notification only once, for all Remotes.
+        msg: Notification = from_params(Notification, meth, params)
+        encoded: Union[str, bytes, None] = _encode_once(msg)
+        create_task = self.eventloop.create_task
+
         return {
-            remote: self.eventloop.create_task(
-                remote.notif(meth, params, quiet=True, **kw)
-            )
-            for remote in self.remotes
+            remote: create_task(remote.notif_message(msg, encoded, quiet=True, **kw))
+            for remote in remotes
         }
 
     async def bcast_request(
@@ -198,42 +293,59 @@ class Server:
             The objects returned are the Futures which will receive the
             Responses from the Remote.
         """
+        remotes = self._remotes_snapshot
         echo(
             "cast",
-            f"Broadcasting {hl_method(meth)} Request to {len(self.remotes)}"
-            f" Remote{'' if len(self.remotes) == 1 else 's'}.",
+            f"Broadcasting {hl_method(meth)} Request to {len(remotes)}"
+            f" Remote{'' if len(remotes) == 1 else 's'}.",
         )
-        if not self.remotes:
+        if not remotes:
             return {}
 
-        tasks: Dict[Remote, Task] = {
-            remote: self.eventloop.create_task(
-                remote.request(meth, params, quiet=True, **kw)
-            )
-            for remote in self.remotes
-        }
-        await gather(*tasks.values(), return_exceptions=True)
-        return {
-            remote: (task.exception() or task.result())
-            for remote, task in tasks.items()
-        }
+        # Assemble and serialize the Request only once, for all Remotes. Each
+        #   Remote keeps its own Futures, so they can all share one ID.
+        req: Request = from_params(
+            Request, meth, params, mid=f"{ID_BCAST}/{randbits(24):0>6X}"
+        )
+        encoded: Union[str, bytes, None] = _encode_once(req)
+
+        results = await gather(
+            *(
+                remote.request_message(req, encoded, quiet=True, **kw)
+                for remote in remotes
+            ),
+            return_exceptions=True,
+        )
+        return dict(zip(remotes, results))
+
+    def add(self, remote: Remote):
+        self._remotes[remote] = None
+        self._remotes_snapshot = tuple(self._remotes)
 
     def drop(self, remote: Remote):
-        if remote in self.remotes:
-            self.remotes.remove(remote)
-            self.total_sent.update(remote.total_sent)
-            self.total_recv.update(remote.total_recv)
+        if remote in self._remotes:
+            del self._remotes[remote]
+            self._remotes_snapshot = tuple(self._remotes)
+
+            self.total_sent += remote.total_sent
+            self.total_recv += remote.total_recv
 
     async def terminate(self, reason: str = "Server Closing"):
-        for remote in list(self.remotes):
-            try:
-                await remote.terminate(reason)
-            except Exception as e:
-                warn(f"Unknown Error from {remote!r}:", e)
-            finally:
-                self.drop(remote)
+        # Work from the Snapshot; Remotes may still be dropped by their own
+        #   Connection Tasks while this runs. Terminate them all at once, rather
+        #   than waiting on each in turn.
+        remotes = self._remotes_snapshot
+        results = await gather(
+            *(remote.terminate(reason) for remote in remotes), return_exceptions=True
+        )
+
+        for remote, result in zip(remotes, results):
+            if isinstance(result, Exception):
+                warn(f"Unknown Error from {remote!r}:", result)
+            self.drop(remote)
 
-        self.remotes.clear()
+        self._remotes.clear()
+        self._remotes_snapshot = ()
 
         if self.server.is_serving():
             self.server.close()
@@ -244,7 +356,14 @@ class Server:
 
     async def open_connection(self, str_in: StreamReader, str_out: StreamWriter):
         """Callback executed by AsyncIO when a Client contacts the Server."""
-        remote = Remote(self.eventloop, str_in, str_out, rtype="Client")
+        remote = Remote(
+            self.eventloop,
+            str_in,
+            str_out,
+            rtype="Client",
+            read_size=self.read_buffer_size,
+            max_frame=self.read_buffer_size,
+        )
         echo(
             "con", f"Incoming Connection from Client at {T.bold_green(remote.host)}.",
         )
@@ -255,7 +374,7 @@ class Server:
         remote.hooks_request_inher = self.hooks_request
         remote.startup = self.startup
 
-        self.remotes.add(remote)
+        self.add(remote)
         echo("diff", f"Client at {remote.host} has been assigned UUID {remote.id}.")
 
         listening = self.eventloop.create_task(remote.loop(self.helpers))
@@ -302,11 +421,14 @@ class Server:
             in instances where other things must be done, and the Server needs
             to be run properly asynchronously.
         """
-        self.eventloop = loop or get_event_loop()
+        self.eventloop = loop or get_running_loop()
 
         echo("info", f"Running Server on {self.addr}:{self.port}")
         self.server = await start_server(
-            self.open_connection, self.addr, self.port, loop=self.eventloop
+            self.open_connection,
+            self.addr,
+            self.port,
+            limit=self.read_buffer_size,
         )
         echo("win", "Ready to begin accepting Requests.")
         # noinspection PyUnresolvedReferences
@@ -316,26 +438,24 @@ class Server:
 
     def report(self, *_):
         try:
-            echo(
-                "info",
-                f"Served {self.total_clients} Clients in"
-                f" {str(dt.utcnow() - self.startup)[:-7]}.",
-            )
-            echo("info", "Sent:")
-            echo(
-                "tab",
-                [
-                    f"> {v} {k.capitalize()}{'' if v == 1 else 's'}"
-                    for k, v in self.total_sent.items()
-                ],
-            )
-            echo("info", "Received:")
-            echo(
-                "tab",
+            P.emit_many(
                 [
-                    f"> {v} {k.capitalize()}{'' if v == 1 else 's'}"
-                    for k, v in self.total_recv.items()
-                ],
+                    (
+                        "info",
+                        f"Served {self.total_clients} Clients in"
+                        f" {str(dt.utcnow() - self.startup)[:-7]}.",
+                    ),
+                    ("info", "Sent:"),
+                    *(
+                        ("tab", f"> {v} {k.capitalize()}{'' if v == 1 else 's'}")
+                        for k, v in self.total_sent.items()
+                    ),
+                    ("info", "Received:"),
+                    *(
+                        ("tab", f"> {v} {k.capitalize()}{'' if v == 1 else 's'}")
+                        for k, v in self.total_recv.items()
+                    ),
+                ]
             )
         except:
             pass
@@ -343,11 +463,38 @@ class Server:
     def start(self, *a, **kw):
         """Run alone and do nothing else. For very simple implementations that
             do not need to do anything else at the same time.
+
+        If uvloop is installed, and ``use_uvloop`` is `True`, its Event Loop is
+            used. The global Event Loop Policy is left as it was found.
         """
         self.setup(*a, **kw)
 
+        if not self.use_uvloop or uvloop is None:
+            self._start(run)
+        elif Runner is not None:
+            with Runner(loop_factory=uvloop.new_event_loop) as runner:
+                self._start(runner.run)
+        else:
+            policy = get_event_loop_policy()
+            set_event_loop_policy(uvloop.EventLoopPolicy())
+            try:
+                self._start(run)
+            finally:
+                set_event_loop_policy(policy)
+
+    async def _run_owned(self):
+        """Run the Server on an Event Loop created by ``start()``. The Loop is
+            ours alone, so its Task Factory may be changed.
+        """
+        loop = get_running_loop()
+        if self.eager_tasks and eager_task_factory is not None:
+            loop.set_task_factory(eager_task_factory)
+
+        return await self.run(loop)
+
+    def _start(self, run: Callable):
         try:
-            run(self.run())
+            run(self._run_owned())
         except KeyboardInterrupt:
             err("INTERRUPTED. Server closing...")
             run(self.terminate("Server Interrupted"))
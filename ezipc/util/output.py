@@ -2,7 +2,16 @@
 
 from datetime import datetime as dt
 from logging import DEBUG, Formatter, getLogger, StreamHandler
-from typing import Callable, Dict, List, overload, Tuple, Union
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    overload,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 
 NOCOLOR = lambda s: s
@@ -52,6 +61,13 @@ colors: Dict[str, Tuple[Callable[[str], str], str, int]] = {
 }
 
 
+# The colored Prefix of each known Message Type never changes, so render each
+#   one only once.
+prefixes: Dict[str, str] = {
+    etype: p_color(prefix) for etype, (p_color, prefix, *_) in colors.items()
+}
+
+
 hl_method = T.bold_yellow
 hl_remote = T.bold_magenta
 hl_rtype = T.underline
@@ -74,9 +90,26 @@ class _Printer:
         self.startup: dt = dt.utcnow()
         self.verbosity: int = verbosity
 
-    def emit(self, etype: str, text: str, color=None):
-        now = dt.utcnow()
+    def enabled(self, etype: str) -> bool:
+        """Determine whether a Message of the given Type would be output at all.
+            Used to skip formatting Messages that would only be thrown away.
+        """
+        if self.file:
+            return True
+
+        spec = colors.get(etype)
+        return (spec[2] if spec else 4) <= self.verbosity
+
+    def _format(self, etype: str, text: str, color=None) -> Optional[str]:
+        """Write a Message to the File, if there is one, and return the Line to
+            be output for it, or `None` if it should not be output.
+        """
         p_color, prefix, pri, *tc = colors.get(etype) or (T.white, etype, 4)
+        if pri > self.verbosity and not self.file:
+            # This will not be output anywhere. Skip the Timestamp.
+            return None
+
+        now = dt.utcnow()
         if tc:
             tc = tc[0]
 
@@ -87,32 +120,63 @@ class _Printer:
                 # flush=True,
             )
         if pri <= self.verbosity:
-            self.output_line(
+            return (
                 # f"<{str(now)[11:-4]}> {p_color(prefix)} {(color or tc or NOCOLOR)(text)}"
-                f"<{now:%T}> {p_color(prefix)} {(color or tc or NOCOLOR)(text)}"
+                f"<{now:%T}> {prefixes.get(etype) or p_color(prefix)}"
+                f" {(color or tc or NOCOLOR)(text)}"
             )
+        else:
+            return None
+
+    def emit(self, etype: str, text: str, color=None):
+        line = self._format(etype, text, color)
+        if line is not None:
+            self.output_line(line)
+
+    def emit_many(self, lines: Iterable[Tuple[str, str]], color=None):
+        """Emit several Messages, each given as a Tuple of its Type and Text.
+
+        The Lines are only joined into one Write when ``output_line`` is still
+            the default, `print`. If it has been replaced, as with a Logger or
+            some other Line-oriented Output, it is called once for each Line
+            instead, so that it never receives more than one Line at a time.
+        """
+        out = [
+            line
+            for line in (self._format(etype, text, color) for etype, text in lines)
+            if line is not None
+        ]
+        if not out:
+            return
+
+        if self.output_line is print:
+            print("\n".join(out))
+        else:
+            for line in out:
+                self.output_line(line)
 
 
 P = _Printer()
 
 
 @overload
-def echo(text: Union[str, List[str]], color=""):
+def echo(text: Union[str, Sequence[str]], color=""):
     ...
 
 
 @overload
-def echo(etype: str, text: Union[str, List[str]], color=""):
+def echo(etype: str, text: Union[str, Sequence[str]], color=""):
     ...
 
 
-def echo(etype: str, text: Union[str, List[str]] = None, color=""):
+def echo(etype: str, text: Union[str, Sequence[str]] = None, color=""):
     if text is None:
         etype, text = "info", etype
 
-    if isinstance(text, list):
+    if isinstance(text, (list, tuple)):
+        emit = P.emit
         for line in text:
-            P.emit(etype, line, color)
+            emit(etype, line, color)
     else:
         P.emit(etype, text, color)
 
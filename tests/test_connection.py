@@ -0,0 +1,30 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase, main
+
+from ezipc.remote.connection import Connection, sep
+
+
+class TestConnection(IsolatedAsyncioTestCase):
+    def connect(self, data: bytes, max_frame: int) -> Connection:
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return Connection(reader, None, read_size=1 << 16, max_frame=max_frame)
+
+    async def test_frame_at_limit(self):
+        conn = self.connect(b"VPa" + b"0" * 97 + sep, 100)
+        self.assertIsInstance(await conn.read(), bytes)
+
+    async def test_complete_frame_over_limit(self):
+        conn = self.connect(b"0" * 101 + sep, 100)
+        with self.assertRaises(asyncio.LimitOverrunError):
+            await conn.read()
+
+    async def test_incomplete_frame_over_limit(self):
+        conn = self.connect(b"0" * 101, 100)
+        with self.assertRaises(asyncio.LimitOverrunError):
+            await conn.read()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import asyncio
+from contextvars import ContextVar
+from unittest import IsolatedAsyncioTestCase, main
+
+from ezipc.remote import Remote
+
+
+VAR: ContextVar = ContextVar("VAR", default="unset")
+
+
+class TestRemote(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        loop = asyncio.get_running_loop()
+        accepted = loop.create_future()
+
+        self.server = await asyncio.start_server(
+            lambda r, w: accepted.set_result((r, w)), "127.0.0.1", 0
+        )
+        port = self.server.sockets[0].getsockname()[1]
+
+        self.near = Remote(
+            loop, *await asyncio.open_connection("127.0.0.1", port), rtype="Near"
+        )
+        self.far = Remote(loop, *await accepted, rtype="Far")
+        self.tasks = [
+            loop.create_task(self.near.loop()),
+            loop.create_task(self.far.loop()),
+        ]
+
+    async def asyncTearDown(self):
+        await self.near.terminate()
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_hook_context_isolated(self):
+        waiting = []
+        release = asyncio.Event()
+
+        @self.far.hook_request("SET")
+        async def set_var(data):
+            VAR.set(data[0])
+            waiting.append(data[0])
+            if len(waiting) == 2:
+                release.set()
+            # Wait until both Hooks have set the Variable before reading it.
+            await release.wait()
+            return [VAR.get()]
+
+        @self.far.hook_request("GET")
+        def get_var(data):
+            return [VAR.get()]
+
+        results = await asyncio.gather(
+            self.near.request("SET", ["a"], timeout=2),
+            self.near.request("SET", ["b"], timeout=2),
+        )
+        self.assertEqual(sorted(results), [["a"], ["b"]])
+        self.assertEqual(await self.near.request("GET", timeout=2), ["unset"])
+
+
+if __name__ == "__main__":
+    main()